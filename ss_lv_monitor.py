@@ -8,16 +8,19 @@ for new advertisements that match the configured criteria.
 
 import os
 import json
-import time
+import asyncio
 import logging
 import smtplib
-import schedule
-from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Set
-import requests
-from bs4 import BeautifulSoup
+import sys
+from array import array
+from datetime import datetime, timezone
+from email.message import EmailMessage
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional, Set, Tuple
+import aiohttp
+import ahocorasick
+import lxml.html
+from lxml import etree
 import re
 
 # =============================================================================
@@ -38,6 +41,8 @@ EMAIL_SMTP_PORT = 587
 EMAIL_FROM = os.getenv("EMAIL_FROM", "your_email@gmail.com")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "your_app_password")
 EMAIL_TO = os.getenv("EMAIL_TO", "recipient@gmail.com")
+EMAIL_SMTP_TIMEOUT_SECONDS = 30
+EMAIL_SMTP_KEEPALIVE_MINUTES = 5  # Keep the SMTP connection between checks only if they run at least this often
 
 # Search criteria - modify these to match your requirements
 SEARCH_CRITERIA = {
@@ -49,12 +54,23 @@ SEARCH_CRITERIA = {
 }
 
 # Scheduling configuration
-RUN_MODE = "single"      # "single" = run once and exit, "continuous" = keep running with schedule
+RUN_MODE = "single"      # "single" = run once and exit, "continuous" = keep running and check every RUN_INTERVAL_HOURS
 RUN_INTERVAL_HOURS = 24  # How often to check for new listings (only used in continuous mode)
 RUN_IMMEDIATELY = True   # Whether to run the check immediately when script starts
 
+# Request configuration
+MAX_CONCURRENT_REQUESTS = 4  # How many URLs are fetched from ss.lv at the same time
+REQUEST_DELAY_SECONDS = 2    # Courtesy delay after each request, held while the slot is still taken
+REQUEST_TIMEOUT_SECONDS = 30
+REQUEST_MAX_RETRIES = 3      # Retries for connection errors, timeouts and RETRY_STATUS_CODES responses
+REQUEST_RETRY_BACKOFF = 0.5  # Base delay in seconds, doubled after each retry
+REQUEST_MAX_RETRY_AFTER = 60 # Upper bound in seconds for a server-sent Retry-After delay
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_AFTER_STATUS_CODES = {429, 503}  # Responses whose Retry-After header is honoured
+
 # File paths
-DATA_FILE = "listings_data.json"
+DATA_FILE = "listings_data.bin"          # Seen listing IDs as little-endian uint64, append-only
+LEGACY_DATA_FILE = "listings_data.json"  # Old JSON format, imported once if DATA_FILE doesn't exist yet
 
 # Logging configuration
 logging.basicConfig(
@@ -68,38 +84,124 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled patterns used when parsing listing rows
+_PRICE_STRIP_RE = re.compile(r'[^\d,.]')
+_AREA_NUM_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Pre-compiled XPath expressions for walking the ss.lv listing table
+_ROW_XPATH = etree.XPath("//tr[starts-with(@id,'tr_')]")
+_CELL_XPATH = etree.XPath("./td")
+_LINK_XPATH = etree.XPath(".//a/@href", smart_strings=False)
+
+def _build_keyword_automaton(keywords: List[str]):
+    """Compile lowercased keywords into an Aho-Corasick automaton, or None if there are none."""
+    if not keywords:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+def _retry_after_seconds(response: aiohttp.ClientResponse) -> Optional[float]:
+    """Read the Retry-After header (seconds or HTTP date) of a throttled response, None if absent."""
+    value = response.headers.get('Retry-After')
+    if response.status not in RETRY_AFTER_STATUS_CODES or not value:
+        return None
+
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), REQUEST_MAX_RETRY_AFTER)
+
+def _is_storable_id(listing_id: str) -> bool:
+    """Check that a listing ID survives the uint64 round trip through DATA_FILE unchanged."""
+    return (listing_id.isascii() and listing_id.isdigit() and not listing_id.startswith('0')
+            and int(listing_id) < 2 ** 64)
+
+# Search keywords matched in a single pass over the lowercased listing text
+_INCLUDE_AC = _build_keyword_automaton(SEARCH_CRITERIA['keywords_include'])
+_EXCLUDE_AC = _build_keyword_automaton(SEARCH_CRITERIA['keywords_exclude'])
+
 # =============================================================================
 # CORE FUNCTIONALITY
 # =============================================================================
 
 class SSLVMonitor:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate'
+        }
+        # Created per check in run_check_async, aiohttp sessions need a running event loop
+        self.session = None
+        self.semaphore = None
+        # IDs seen during this check that are not yet stored in DATA_FILE
+        self._new_this_run: List[str] = []
         self.known_listings = self.load_known_listings()
+        # Logged-in SMTP connection. It is only kept open between checks for short continuous-mode
+        # intervals: servers drop idle connections after a few minutes, and NOOP on a dropped
+        # connection can block for EMAIL_SMTP_TIMEOUT_SECONDS before reconnecting.
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._keep_smtp_open = (RUN_MODE == "continuous"
+                                and RUN_INTERVAL_HOURS * 60 <= EMAIL_SMTP_KEEPALIVE_MINUTES)
 
     def load_known_listings(self) -> Set[str]:
-        """Load previously seen listing IDs from JSON file."""
+        """Load previously seen listing IDs from the binary data file."""
         try:
             if os.path.exists(DATA_FILE):
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
+                with open(DATA_FILE, 'rb') as f:
+                    raw = f.read()
+
+                ids = array('Q')
+                # Cut a trailing partial record left by an interrupted write off the file itself,
+                # otherwise every record appended after it would be misaligned
+                partial = len(raw) % ids.itemsize
+                if partial:
+                    logger.warning(f"Dropping {partial} trailing bytes from corrupted {DATA_FILE}")
+                    raw = raw[:len(raw) - partial]
+                    os.truncate(DATA_FILE, len(raw))
+                ids.frombytes(raw)
+                if sys.byteorder == 'big':
+                    ids.byteswap()
+
+                return set(map(str, ids))
+
+            if os.path.exists(LEGACY_DATA_FILE):
+                with open(LEGACY_DATA_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    return set(data.get('known_listings', []))
+                    # Queue the legacy IDs so the first save writes them to DATA_FILE
+                    legacy_ids = dict.fromkeys(data.get('known_listings', []))
+                    self._new_this_run = [i for i in legacy_ids if _is_storable_id(i)]
+                    return set(self._new_this_run)
         except Exception as e:
             logger.error(f"Error loading known listings: {e}")
         return set()
 
     def save_known_listings(self):
-        """Save known listing IDs to JSON file."""
+        """Append listing IDs seen since the last save to the binary data file."""
         try:
-            data = {
-                'known_listings': list(self.known_listings),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if not self._new_this_run:
+                return
+
+            ids = array('Q')
+            for listing_id in self._new_this_run:
+                if _is_storable_id(listing_id):
+                    ids.append(int(listing_id))
+                else:
+                    logger.warning(f"Not saving listing ID {listing_id!r}, it doesn't fit the data file format")
+            if sys.byteorder == 'big':
+                ids.byteswap()
+
+            with open(DATA_FILE, 'ab') as f:
+                f.write(ids.tobytes())
+
+            self._new_this_run = []
         except Exception as e:
             logger.error(f"Error saving known listings: {e}")
 
@@ -109,8 +211,7 @@ class SSLVMonitor:
             return 0
         
         # Remove currency symbols and spaces, extract numbers
-        price_clean = re.sub(r'[^\d,.]', '', price_text)
-        price_clean = price_clean.replace(',', '')
+        price_clean = _PRICE_STRIP_RE.sub('', price_text).replace(',', '')
         
         try:
             return float(price_clean)
@@ -123,7 +224,7 @@ class SSLVMonitor:
             return 0
         
         # Look for number followed by m² or similar
-        area_match = re.search(r'(\d+(?:\.\d+)?)', area_text)
+        area_match = _AREA_NUM_RE.search(area_text)
         if area_match:
             try:
                 return float(area_match.group(1))
@@ -145,20 +246,23 @@ class SSLVMonitor:
             if area > 0 and area < SEARCH_CRITERIA['min_area']:
                 return False
 
-            # Keyword checks
+            # Keyword checks, the listing text is only built when there are keywords to match
+            if _INCLUDE_AC is None and _EXCLUDE_AC is None:
+                return True
+
             text_content = f"{listing.get('title', '')} {listing.get('description', '')}".lower()
             
             # Check for required keywords
-            if SEARCH_CRITERIA['keywords_include']:
-                has_required = any(keyword.lower() in text_content for keyword in SEARCH_CRITERIA['keywords_include'])
+            if _INCLUDE_AC is not None:
+                has_required = any(True for _ in _INCLUDE_AC.iter(text_content))
                 if not has_required:
-                      return False
+                    return False
 
             # Check for excluded keywords
-            if SEARCH_CRITERIA['keywords_exclude']:
-                 has_excluded = any(keyword.lower() in text_content for keyword in SEARCH_CRITERIA['keywords_exclude'])
-                 if has_excluded:
-                     return False
+            if _EXCLUDE_AC is not None:
+                has_excluded = any(True for _ in _EXCLUDE_AC.iter(text_content))
+                if has_excluded:
+                    return False
 
             return True
 
@@ -166,116 +270,143 @@ class SSLVMonitor:
             logger.error(f"Error checking criteria for listing: {e}")
             return False
 
-    def scrape_listings(self, url: str) -> List[Dict]:
-        """Scrape listings from a given ss.lv URL."""
-        listings = []
+    async def fetch_page(self, url: str) -> lxml.html.HtmlElement:
+        """Download and parse a page, limiting how many requests hit ss.lv at once."""
+        async with self.semaphore:
+            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            for attempt in range(REQUEST_MAX_RETRIES + 1):
+                retry_after = None
+                try:
+                    async with self.session.get(url, timeout=timeout) as response:
+                        if response.status not in RETRY_STATUS_CODES or attempt == REQUEST_MAX_RETRIES:
+                            response.raise_for_status()
+                            # Feed the body to libxml2 as it arrives instead of buffering it first
+                            parser = lxml.html.HTMLParser(encoding=response.charset)
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                parser.feed(chunk)
+                            tree = parser.close()
+                            break
+                        reason = f"HTTP {response.status}"
+                        retry_after = _retry_after_seconds(response)
+                except aiohttp.ClientResponseError:
+                    # Error statuses outside RETRY_STATUS_CODES, or the last attempt
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt == REQUEST_MAX_RETRIES:
+                        raise
+                    reason = f"{type(e).__name__} {e}".strip()
+
+                delay = retry_after if retry_after is not None else REQUEST_RETRY_BACKOFF * 2 ** attempt
+                logger.warning(f"Got {reason} from {url}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+            # Small delay between requests to be respectful
+            await asyncio.sleep(REQUEST_DELAY_SECONDS)
+
+        return tree
+
+    async def scrape_listings(self, url: str) -> List[Tuple[str, etree._Element]]:
+        """Scrape listing rows from a given ss.lv URL, paired with their listing IDs."""
+        rows = []
         
         try:
             logger.info(f"Scraping URL: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = await self.fetch_page(url)
             
             # Find listing rows - ss.lv uses table structure
-            listing_rows = soup.find_all('tr', id=lambda x: x and x.startswith('tr_'))
-            
-            for row in listing_rows:
-                try:
-                    listing_id = row.get('id', '').replace('tr_', '')
-                    if not listing_id:
-                        continue
-
-                    # Extract listing details
-                    cells = row.find_all('td')
-                    if len(cells) < 4:
-                        continue
-
-                    # Title and link (usually in first or second cell)
-                    title_cell = None
-                    link = None
-                    for cell in cells:
-                        link_elem = cell.find('a')
-                        if link_elem and link_elem.get('href'):
-                            title_cell = cell
-                            link = link_elem.get('href')
-                            if not link.startswith('http'):
-                                link = 'https://www.ss.lv' + link
-                            break
-
-                    if not title_cell or not link:
-                        continue
-
-                    title = title_cell.get_text(strip=True)
-                    
-                    # Extract price (usually in a cell with euro symbol)
-                    price = 0
-                    for cell in cells:
-                        cell_text = cell.get_text(strip=True)
-                        if '€' in cell_text or 'EUR' in cell_text:
-                            price = self.extract_price(cell_text)
-                            break
-
-                    # Extract area (look for m² symbol)
-                    area = 0
-                    for cell in cells:
-                        cell_text = cell.get_text(strip=True)
-                        if 'm²' in cell_text or 'm2' in cell_text:
-                            area = self.extract_area(cell_text)
-                            break
-
-                    # Extract location/description from remaining cells
-                    description_parts = []
-                    for cell in cells:
-                        text = cell.get_text(strip=True)
-                        if text and text != title and '€' not in text and 'm²' not in text:
-                            description_parts.append(text)
-
-                    listing = {
-                        'id': listing_id,
-                        'title': title,
-                        'price': price,
-                        'area': area,
-                        'description': ' | '.join(description_parts),
-                        'link': link,
-                        'source_url': url,
-                        'scraped_at': datetime.now().isoformat()
-                    }
-
-                    listings.append(listing)
-
-                except Exception as e:
-                    logger.error(f"Error parsing listing row: {e}")
-                    continue
+            for row in _ROW_XPATH(tree):
+                listing_id = row.get('id')[3:]
+                # Real listings have numeric IDs, skip banner rows such as tr_bnr_*
+                if _is_storable_id(listing_id):
+                    rows.append((listing_id, row))
 
         except Exception as e:
             logger.error(f"Error scraping URL {url}: {e}")
         
-        logger.info(f"Found {len(listings)} listings from {url}")
-        return listings
+        logger.info(f"Found {len(rows)} listings from {url}")
+        return rows
 
-    def check_for_new_listings(self) -> List[Dict]:
+    def _parse_row(self, listing_id: str, row: etree._Element, url: str, scraped_at: str) -> Optional[Dict]:
+        """Extract listing details from a listing row, None if the row isn't a usable listing."""
+        try:
+            cells = _CELL_XPATH(row)
+            if len(cells) < 4:
+                return None
+
+            # Single pass over the cells, each cell's text is extracted only once
+            title = ''
+            link = None
+            price = 0
+            area = 0
+            title_idx = price_idx = area_idx = None
+            texts = [cell.text_content().strip() for cell in cells]
+            for i, (text, cell) in enumerate(zip(texts, cells)):
+                # Title and link (usually in first or second cell)
+                if title_idx is None and (hrefs := _LINK_XPATH(cell)) and hrefs[0]:
+                    title_idx = i
+                    title = text
+                    link = hrefs[0]
+                    if not link.startswith('http'):
+                        link = 'https://www.ss.lv' + link
+                # Extract price (usually in a cell with euro symbol)
+                elif price_idx is None and ('€' in text or 'EUR' in text):
+                    price_idx = i
+                    price = self.extract_price(text)
+                # Extract area (look for m² symbol)
+                elif area_idx is None and ('m²' in text or 'm2' in text):
+                    area_idx = i
+                    area = self.extract_area(text)
+
+            if not link:
+                return None
+
+            # Extract location/description from remaining cells
+            used_idx = {title_idx, price_idx, area_idx}
+            description_parts = [text for i, text in enumerate(texts) if text and i not in used_idx]
+
+            return {
+                'id': listing_id,
+                'title': title,
+                'price': price,
+                'area': area,
+                'description': ' | '.join(description_parts),
+                'link': link,
+                'source_url': url,
+                'scraped_at': scraped_at
+            }
+
+        except Exception as e:
+            logger.error(f"Error parsing listing row: {e}")
+            return None
+
+    async def check_for_new_listings(self) -> List[Dict]:
         """Check all monitored URLs for new listings that meet criteria."""
         new_matching_listings = []
-        
-        for url in URLS_TO_MONITOR:
+        # One timestamp for the whole check, shared by every listing parsed in it
+        scraped_at = datetime.now().isoformat()
+
+        # Download and parse all URLs concurrently, results keep the URLS_TO_MONITOR order
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.scrape_listings(url)) for url in URLS_TO_MONITOR]
+
+        for url, task in zip(URLS_TO_MONITOR, tasks):
             try:
-                listings = self.scrape_listings(url)
-                
-                for listing in listings:
-                    listing_id = listing['id']
+                for listing_id, row in task.result():
+                    # Only new listings are parsed, known ones are skipped before any extraction
+                    if listing_id in self.known_listings:
+                        continue
+
+                    listing = self._parse_row(listing_id, row, url, scraped_at)
+                    if listing is None:
+                        continue
+
+                    self.known_listings.add(listing_id)
+                    self._new_this_run.append(listing_id)
                     
-                    # Check if this is a new listing
-                    if listing_id not in self.known_listings:
-                        self.known_listings.add(listing_id)
-                        
-                        # Check if it meets our criteria
-                        if self.meets_criteria(listing):
-                            new_matching_listings.append(listing)
-                            logger.info(f"New matching listing found: {listing['title']} - {listing['price']}€")
-                
-                # Small delay between requests to be respectful
-                time.sleep(2)
+                    # Check if it meets our criteria
+                    if self.meets_criteria(listing):
+                        new_matching_listings.append(listing)
+                        logger.info(f"New matching listing found: {listing['title']} - {listing['price']}€")
                 
             except Exception as e:
                 logger.error(f"Error checking URL {url}: {e}")
@@ -285,6 +416,37 @@ class SSLVMonitor:
         
         return new_matching_listings
 
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return a logged-in SMTP connection, reusing the previous one if it still answers NOOP."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+
+        server = smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT, timeout=EMAIL_SMTP_TIMEOUT_SECONDS)
+        try:
+            server.starttls()
+            server.login(EMAIL_FROM, EMAIL_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _close_smtp(self):
+        """Close the cached SMTP connection, ignoring errors from one the server already dropped."""
+        if self._smtp is None:
+            return
+
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
+
     def send_email_notification(self, listings: List[Dict]):
         """Send email notification for new listings."""
         if not listings:
@@ -292,28 +454,28 @@ class SSLVMonitor:
 
         try:
             # Create email content
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = EMAIL_FROM
             msg['To'] = EMAIL_TO
             msg['Subject'] = f"SS.LV Alert: {len(listings)} New Matching Listing(s) Found"
 
-            # Create email body
-            body = f"""
+            # Create email body, parts are joined once at the end
+            parts = ["""
 New real estate listings matching your criteria have been found on SS.LV:
 
-"""
+"""]
             
             for i, listing in enumerate(listings, 1):
-                body += f"""
+                parts.append(f"""
 {i}. {listing['title']}
    Price: {listing['price']}€
    Area: {listing['area']} m²
    Description: {listing['description']}
    Link: {listing['link']}
    
-"""
+""")
 
-            body += f"""
+            parts.append(f"""
 Search Criteria:
 - Price range: {SEARCH_CRITERIA['min_price']}€ - {SEARCH_CRITERIA['max_price']}€
 - Minimum area: {SEARCH_CRITERIA['min_area']} m²
@@ -324,27 +486,37 @@ Happy house hunting!
 
 ---
 This is an automated message from your SS.LV monitoring script.
-"""
+""")
 
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
+            msg.set_content(''.join(parts))
 
-            # Send email
-            with smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT) as server:
-                server.starttls()
-                server.login(EMAIL_FROM, EMAIL_PASSWORD)
-                server.send_message(msg)
+            # Send email, reconnecting once if the kept-alive connection was dropped mid-send
+            try:
+                self._get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                self._get_smtp().send_message(msg)
 
             logger.info(f"Email notification sent for {len(listings)} new listings")
 
         except Exception as e:
             logger.error(f"Error sending email notification: {e}")
 
-    def run_check(self):
+        finally:
+            if not self._keep_smtp_open:
+                self._close_smtp()
+
+    async def run_check_async(self):
         """Run a complete check for new listings and send notifications if needed."""
         logger.info("Starting SS.LV listing check...")
         
         try:
-            new_listings = self.check_for_new_listings()
+            # One pooled keep-alive connection per concurrent request, reused across URLs
+            connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS)
+            async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+                self.session = session
+                self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+                new_listings = await self.check_for_new_listings()
             
             if new_listings:
                 logger.info(f"Found {len(new_listings)} new matching listings")
@@ -357,6 +529,12 @@ This is an automated message from your SS.LV monitoring script.
         
         logger.info("SS.LV listing check completed")
 
+async def scheduler(monitor: SSLVMonitor):
+    """Run a check every RUN_INTERVAL_HOURS hours until the process is stopped."""
+    while True:
+        await asyncio.sleep(RUN_INTERVAL_HOURS * 3600)
+        await monitor.run_check_async()
+
 def main():
     """Main function to set up and run the monitoring script."""
     logger.info("SS.LV Real Estate Monitor starting...")
@@ -368,17 +546,14 @@ def main():
     
     if RUN_IMMEDIATELY:
         logger.info("Running check...")
-        monitor.run_check()
+        asyncio.run(monitor.run_check_async())
     
     if RUN_MODE == "continuous":
-        # Schedule regular checks for continuous mode
-        schedule.every(RUN_INTERVAL_HOURS).hours.do(monitor.run_check)
+        # Regular checks for continuous mode, the process sleeps between checks
         logger.info(f"Scheduled to check every {RUN_INTERVAL_HOURS} hours. Press Ctrl+C to stop.")
         
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute for scheduled tasks
+            asyncio.run(scheduler(monitor))
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
     else: